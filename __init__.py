@@ -10,6 +10,7 @@ from .observable_agent import (
     ProtocolDescriptor,
     EnglishReport,
     GatewayClient,
+    GatewayError,
     MockGatewayClient,
     looks_like_english,
     REPORT_INTERVAL_SEC,
@@ -23,6 +24,7 @@ __all__ = [
     "ProtocolDescriptor", 
     "EnglishReport",
     "GatewayClient",
+    "GatewayError",
     "MockGatewayClient",
     "looks_like_english",
     "REPORT_INTERVAL_SEC",
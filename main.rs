@@ -9,6 +9,7 @@
 //! - `POST /register_protocol_for_agent` - Register a protocol
 //! - `POST /report` - Submit an English translation report
 //! - `POST /send` - Send a message (gated by compliance)
+//! - `POST /report_with_message` - Submit a report, then send a message
 //! - `GET /health` - Health check
 
 use axum::{
@@ -118,6 +119,13 @@ struct SendMessageRequest {
     ts: Option<f64>,
 }
 
+/// Report submitted together with the message that triggered it
+#[derive(Debug, Clone, Serialize, Deserialize)]
+struct ReportWithMessageRequest {
+    report: EnglishReport,
+    message: SendMessageRequest,
+}
+
 /// Generic API response
 #[derive(Debug, Serialize)]
 struct ApiResponse {
@@ -429,6 +437,19 @@ async fn send_message(
     (StatusCode::OK, Json(ApiResponse::success()))
 }
 
+/// Submit a report and send the message that triggered it in one request.
+/// The message is only sent if the report is accepted.
+async fn report_with_message(
+    State(state): State<AppState>,
+    Json(req): Json<ReportWithMessageRequest>,
+) -> (StatusCode, Json<ApiResponse>) {
+    let (status, resp) = submit_report(State(state.clone()), Json(req.report)).await;
+    if status != StatusCode::OK {
+        return (status, resp);
+    }
+    send_message(State(state), Json(req.message)).await
+}
+
 // =============================================================================
 // Main
 // =============================================================================
@@ -454,6 +475,7 @@ async fn main() {
         .route("/register_protocol_for_agent", post(register_protocol_for_agent))
         .route("/report", post(submit_report))
         .route("/send", post(send_message))
+        .route("/report_with_message", post(report_with_message))
         .layer(cors)
         .with_state(state);
 
@@ -6,6 +6,7 @@ the governance framework to enable novel-language use with
 mandatory English reporting.
 """
 
+import logging
 import os
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
@@ -34,6 +35,14 @@ class GovernedMoltBotAgent(ObservableAgent):
     Replace the placeholder methods with your actual MoltBot logic.
     """
     
+    __slots__ = ("moltbot_config", "_encoding_table", "_decoding_table")
+    
+    # English summary formatters, keyed by the message's "cmd" field
+    _SUMMARY_FORMATTERS = {
+        "assign": lambda m: f"Task assignment: {m.get('task')}",
+        "ack": lambda m: f"Acknowledged message {m.get('ref')}",
+    }
+    
     def __init__(
         self, 
         agent_id: str,
@@ -71,43 +80,46 @@ class GovernedMoltBotAgent(ObservableAgent):
         Replace with your actual encoding logic.
         """
         # Example: Simple key-value encoding
-        parts = []
-        for key, value in message.items():
-            parts.append(f"{key}={value}")
-        return "|".join(parts)
+        return "|".join(f"{key}={value}" for key, value in message.items())
+    
+    def _encode_assign(self, task_id: str, priority: int) -> str:
+        """
+        Specialized encode_message() for the fixed task-assignment schema.
+        Keep in sync with encode_message() if you replace the encoding.
+        """
+        return f"cmd=assign|task={task_id}|pri={priority}"
     
     def decode_message(self, encoded: str) -> Dict[str, Any]:
         """
         Decode a compressed message back to structured form.
         Replace with your actual decoding logic.
         """
-        result = {}
-        for part in encoded.split("|"):
-            if "=" in part:
-                key, value = part.split("=", 1)
-                result[key] = value
-        return result
+        return dict(part.split("=", 1) for part in encoded.split("|") if "=" in part)
     
-    def _build_english_report(self) -> EnglishReport:
+    def _build_english_report(
+        self,
+        message_ids: List[str],
+        raw_messages: List[str],
+        window_end: float
+    ) -> EnglishReport:
         """
         Override to provide actual translations based on your protocol.
         """
         if self.protocol is None:
             raise RuntimeError("Protocol not registered")
         
-        # Decode all buffered messages
-        decoded_messages = []
-        for ts, msg_id, raw in self._novel_buffer:
+        # Decode each buffered message and summarize it in the same pass
+        summary_parts = []
+        for i, raw in enumerate(raw_messages):
             try:
-                decoded = self.decode_message(raw)
-                decoded_messages.append(decoded)
+                msg = self.decode_message(raw)
             except Exception as e:
-                decoded_messages.append({"_raw": raw, "_error": str(e)})
-        
-        # Generate human-readable summary
-        summary_parts = []
-        for i, msg in enumerate(decoded_messages):
-            if "task" in msg:
+                msg = {"_raw": raw, "_error": str(e)}
+            fmt = self._SUMMARY_FORMATTERS.get(msg.get("cmd"))
+            if fmt is not None:
+                summary_parts.append(fmt(msg))
+            # Messages without a known cmd are summarized by their keys
+            elif "task" in msg:
                 summary_parts.append(f"Task assignment: {msg.get('task')}")
             elif "ack" in msg:
                 summary_parts.append(f"Acknowledged message {msg.get('ack')}")
@@ -117,7 +129,7 @@ class GovernedMoltBotAgent(ObservableAgent):
                 summary_parts.append(f"Message {i+1}: {msg}")
         
         english_summary = (
-            f"MoltBot coordination report ({len(self._novel_buffer)} messages). "
+            f"MoltBot coordination report ({len(message_ids)} messages). "
             + "; ".join(summary_parts[:10])  # Limit to first 10 for brevity
         )
         if len(summary_parts) > 10:
@@ -128,8 +140,8 @@ class GovernedMoltBotAgent(ObservableAgent):
             protocol_name=self.protocol.name,
             protocol_version=self.protocol.version,
             window_start_ts=self._window_start_ts,
-            window_end_ts=__import__('time').time(),
-            message_ids=[mid for _, mid, _ in self._novel_buffer],
+            window_end_ts=window_end,
+            message_ids=message_ids,
             english_summary=english_summary,
             coverage=1.0,
             self_confidence=0.9,
@@ -138,12 +150,7 @@ class GovernedMoltBotAgent(ObservableAgent):
     
     def send_task_assignment(self, to: str, task_id: str, priority: int):
         """High-level method to assign a task to another agent."""
-        encoded = self.encode_message({
-            "cmd": "assign",
-            "task": task_id,
-            "pri": priority
-        })
-        return self.send(to, encoded)
+        return self.send(to, self._encode_assign(task_id, priority))
     
     def send_acknowledgment(self, to: str, message_id: str):
         """High-level method to acknowledge a message."""
@@ -163,6 +170,8 @@ class TieredGovernanceAgent(ObservableAgent):
     Example showing different reporting intervals based on risk tier.
     """
     
+    __slots__ = ("risk_tier",)
+    
     RISK_INTERVALS = {
         "low": 120,      # 2 minutes
         "medium": 60,    # 1 minute
@@ -170,28 +179,29 @@ class TieredGovernanceAgent(ObservableAgent):
         "critical": 5,   # 5 seconds
     }
     
+    RISK_MAX_MESSAGES = {
+        "low": 50,
+        "medium": 25,
+        "high": 10,
+        "critical": 5,
+    }
+    
     def __init__(self, agent_id: str, gateway: GatewayClient, risk_tier: str = "medium"):
         super().__init__(agent_id, gateway)
         self.risk_tier = risk_tier
     
-    def _needs_report(self) -> bool:
+    def _needs_report(self, now: float) -> bool:
         """Override to use risk-based intervals."""
         if self._novel_count_since_report == 0:
             return False
         
         interval = self.RISK_INTERVALS.get(self.risk_tier, 60)
         
-        import time
-        if (time.time() - self._last_report_ts) >= interval:
+        if (now - self._last_report_ts) >= interval:
             return True
         
         # Also check message count (scales with risk)
-        max_messages = {
-            "low": 50,
-            "medium": 25,
-            "high": 10,
-            "critical": 5,
-        }.get(self.risk_tier, 25)
+        max_messages = self.RISK_MAX_MESSAGES.get(self.risk_tier, 25)
         
         return self._novel_count_since_report >= max_messages
 
@@ -214,6 +224,8 @@ class EvaluatedAgent(ObservableAgent):
     for fidelity verification before submission.
     """
     
+    __slots__ = ("evaluator_url",)
+    
     def __init__(
         self, 
         agent_id: str, 
@@ -223,7 +235,11 @@ class EvaluatedAgent(ObservableAgent):
         super().__init__(agent_id, gateway)
         self.evaluator_url = evaluator_url
     
-    def _evaluate_report(self, report: EnglishReport) -> EvaluatorResult:
+    def _evaluate_report(
+        self,
+        report: EnglishReport,
+        raw_messages: List[str]
+    ) -> EvaluatorResult:
         """
         Send report to external evaluator for verification.
         Replace with actual HTTP call to your evaluator service.
@@ -237,14 +253,16 @@ class EvaluatedAgent(ObservableAgent):
             )
         
         # In production: POST to evaluator service
-        # response = requests.post(
+        # response = urllib3.PoolManager().request(
+        #     "POST",
         #     self.evaluator_url,
-        #     json={
+        #     body=orjson.dumps({
         #         "report": report.to_dict(),
-        #         "raw_messages": [msg for _, _, msg in self._novel_buffer]
-        #     }
+        #         "raw_messages": raw_messages
+        #     }),
+        #     headers={"Content-Type": "application/json"}
         # )
-        # return EvaluatorResult(**response.json())
+        # return EvaluatorResult(**orjson.loads(response.data))
         
         # Placeholder
         return EvaluatorResult(
@@ -253,12 +271,12 @@ class EvaluatedAgent(ObservableAgent):
             approved=True
         )
     
-    def _submit_report_and_reset(self) -> None:
+    def _prepare_report(self, now: float) -> EnglishReport:
         """Override to include evaluation step."""
-        report = self._build_english_report()
+        report = self._build_english_report(self._id_buf, self._raw_buf, now)
         
         # Evaluate before submitting
-        eval_result = self._evaluate_report(report)
+        eval_result = self._evaluate_report(report, self._raw_buf)
         
         if not eval_result.approved:
             raise RuntimeError(
@@ -270,18 +288,7 @@ class EvaluatedAgent(ObservableAgent):
             report.self_confidence, 
             eval_result.fidelity_score
         )
-        
-        # Now submit to gateway
-        result = self.gateway.submit_report(report)
-        if not result.get("ok"):
-            raise RuntimeError(f"Report rejected: {result.get('error')}")
-        
-        # Reset
-        import time
-        self._last_report_ts = time.time()
-        self._window_start_ts = self._last_report_ts
-        self._novel_buffer.clear()
-        self._novel_count_since_report = 0
+        return report
 
 
 # =============================================================================
@@ -289,6 +296,8 @@ class EvaluatedAgent(ObservableAgent):
 # =============================================================================
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+    
     print("=" * 60)
     print("Agent Governance - MoltBot Integration Demo")
     print("=" * 60)
@@ -11,14 +11,34 @@ This module provides:
 
 from __future__ import annotations
 
+import array
+import functools
 import hashlib
-import json
+import logging
+import os
 import re
+import sys
 import time
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Tuple
-import requests
-from requests.exceptions import RequestException
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+import orjson
+import urllib3
+from urllib3.exceptions import HTTPError
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Optional: JIT character scan for long messages
+    np = None
+    njit = None
+
+logger = logging.getLogger(__name__)
+_log_level = os.environ.get("MOLTBOT_LOG_LEVEL")
+if _log_level:
+    if isinstance(logging.getLevelName(_log_level.upper()), int):
+        logger.setLevel(_log_level.upper())
+    else:
+        logger.warning("Ignoring unknown MOLTBOT_LOG_LEVEL %r", _log_level)
 
 # -----------------------------
 # Configuration (override via environment or config file)
@@ -33,7 +53,72 @@ MIN_SUMMARY_LENGTH = 30
 # Replace with model-based classifier for production use.
 # -----------------------------
 _english_word_re = re.compile(r"[A-Za-z]{2,}")
-_non_ascii_re = re.compile(r"[^\x00-\x7F]+")
+
+# Translation tables for single-pass character counting.
+_VOWEL_TRANS = str.maketrans("", "", "aeiouAEIOU")
+_NON_ALPHA_BYTES = bytes(
+    b for b in range(256) if not (0x41 <= b <= 0x5A or 0x61 <= b <= 0x7A)
+)
+
+# Below this length the translate path beats the JIT call overhead.
+_SCAN_JIT_MIN_LEN = 256
+
+# Verdicts are memoized for repeated short messages; longer ones bypass the cache.
+_ENGLISH_CACHE_SIZE = 4096
+_ENGLISH_CACHE_MAX_LEN = 1024
+
+if njit is not None:
+    @njit
+    def _scan(buf):
+        """Count (letters, vowels) in an ASCII byte buffer in one pass."""
+        letters = 0
+        vowels = 0
+        for i in range(len(buf)):
+            c = buf[i] | 0x20  # fold to lowercase
+            if 0x61 <= c <= 0x7A:
+                letters += 1
+                if c == 0x61 or c == 0x65 or c == 0x69 or c == 0x6F or c == 0x75:
+                    vowels += 1
+        return letters, vowels
+
+    # Compile at import so the JIT cost doesn't land on the first message
+    _scan(np.frombuffer(b"warm up", dtype=np.uint8))
+else:
+    _scan = None
+
+
+def _looks_like_english_uncached(text: str) -> bool:
+    """Uncached implementation of looks_like_english()."""
+    if not text.strip():
+        return True
+
+    # Non-ASCII characters suggest non-English or encoded content
+    if not text.isascii():
+        return False
+
+    # Short ASCII text can't fail the word or vowel checks below
+    if len(text) <= 30:
+        return True
+
+    # Check for recognizable English words
+    if len(text) > 40 and len(_english_word_re.findall(text)) < 3:
+        return False
+
+    # Vowel ratio check (English typically has ~30-40% vowels)
+    if _scan is not None and len(text) >= _SCAN_JIT_MIN_LEN:
+        letters, vowels = _scan(np.frombuffer(text.encode("ascii"), dtype=np.uint8))
+    else:
+        vowels = len(text) - len(text.translate(_VOWEL_TRANS))
+        letters = len(text.encode("ascii").translate(None, _NON_ALPHA_BYTES))
+    if letters > 0 and (vowels / letters) < 0.20 and len(text) > 30:
+        return False
+
+    return True
+
+
+_looks_like_english_cached = functools.lru_cache(maxsize=_ENGLISH_CACHE_SIZE)(
+    _looks_like_english_uncached
+)
 
 
 def looks_like_english(text: str) -> bool:
@@ -45,43 +130,40 @@ def looks_like_english(text: str) -> bool:
     - Very low vowel ratio
     - Very few recognizable words
     
+    Results for messages up to 1 KB are memoized; call
+    looks_like_english.cache_clear() to drop them.
+    
     For production, replace with:
     - Language model classifier
     - Entropy-based detection
     - Compression ratio analysis
     """
-    if not text.strip():
-        return True
-
-    # Non-ASCII characters suggest non-English or encoded content
-    non_ascii = len(_non_ascii_re.findall(text))
-    if non_ascii > 0:
-        return False
+    if len(text) > _ENGLISH_CACHE_MAX_LEN:
+        return _looks_like_english_uncached(text)
+    return _looks_like_english_cached(text)
 
-    # Check for recognizable English words
-    words = _english_word_re.findall(text)
-    if len(words) < 3 and len(text) > 40:
-        return False
-
-    # Vowel ratio check (English typically has ~30-40% vowels)
-    vowels = sum(text.lower().count(v) for v in "aeiou")
-    letters = sum(c.isalpha() for c in text)
-    if letters > 0 and (vowels / letters) < 0.20 and len(text) > 30:
-        return False
 
-    return True
+looks_like_english.cache_clear = _looks_like_english_cached.cache_clear
+looks_like_english.cache_info = _looks_like_english_cached.cache_info
 
 
-def sha256_hex(s: str) -> str:
-    """Generate SHA-256 hash as hex string."""
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+def _msg_id(content: str, ts: float) -> str:
+    """Generate a SHA-256 message ID from content and send timestamp."""
+    h = hashlib.sha256()
+    h.update(content.encode("utf-8"))
+    h.update(f"{ts:.6f}".encode("ascii"))
+    return h.hexdigest()
 
 
 # -----------------------------
 # Data Structures
 # -----------------------------
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ProtocolDescriptor:
     """
     Metadata describing a novel-language protocol.
@@ -95,10 +177,17 @@ class ProtocolDescriptor:
     translation_method: str    # How English reports are derived
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "version": self.version,
+            "purpose": self.purpose,
+            "scope": self.scope,
+            "risk_tier": self.risk_tier,
+            "translation_method": self.translation_method,
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EnglishReport:
     """
     Mandatory English translation report for novel-language usage.
@@ -116,13 +205,39 @@ class EnglishReport:
     notes: str = ""                 # Optional additional context
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "agent_id": self.agent_id,
+            "protocol_name": self.protocol_name,
+            "protocol_version": self.protocol_version,
+            "window_start_ts": self.window_start_ts,
+            "window_end_ts": self.window_end_ts,
+            "message_ids": list(self.message_ids),
+            "english_summary": self.english_summary,
+            "coverage": self.coverage,
+            "self_confidence": self.self_confidence,
+            "notes": self.notes,
+        }
 
 
 # -----------------------------
 # Gateway Client
 # -----------------------------
 
+class GatewayError(HTTPError):
+    """
+    Error response from the Policy Gateway.
+    
+    Attributes:
+        status: HTTP status code (400, 403, 429, ...)
+        data: Decoded JSON error body, or the raw bytes if it was not JSON
+    """
+
+    def __init__(self, status: int, data: Any, url: str) -> None:
+        super().__init__(f"{status} Error for url: {url}: {data!r}")
+        self.status = status
+        self.data = data
+
+
 class GatewayClient:
     """
     HTTP client for communicating with the Policy Gateway.
@@ -142,27 +257,34 @@ class GatewayClient:
         self.api_key = api_key
         self.timeout = timeout
         self.verify_ssl = verify_ssl
-        self._session = requests.Session()
-        self._session.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        })
+        self._pool = urllib3.PoolManager(
+            maxsize=4,
+            cert_reqs="CERT_REQUIRED" if verify_ssl else "CERT_NONE",
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}"
+            },
+        )
 
     def _post(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Make a POST request to the gateway."""
         url = f"{self.base_url}{endpoint}"
         try:
-            response = self._session.post(
+            response = self._pool.request(
+                "POST",
                 url,
-                json=payload,
-                timeout=self.timeout,
-                verify=self.verify_ssl
+                body=orjson.dumps(payload),
+                timeout=self.timeout
             )
-            response.raise_for_status()
-            return response.json()
-        except RequestException as e:
-            # Log the error in production
-            print(f"[GatewayClient] Error calling {url}: {e}")
+            if response.status >= 400:
+                try:
+                    data = orjson.loads(response.data)
+                except orjson.JSONDecodeError:
+                    data = response.data
+                raise GatewayError(response.status, data, url)
+            return orjson.loads(response.data)
+        except (HTTPError, orjson.JSONDecodeError) as e:
+            logger.error("[GatewayClient] Error calling %s: %s", url, e)
             raise
 
     def register_protocol(self, agent_id: str, pd: ProtocolDescriptor) -> Dict[str, Any]:
@@ -182,7 +304,9 @@ class GatewayClient:
         agent_id: str, 
         to: str, 
         content: str, 
-        protocol: Optional[Tuple[str, str]] = None
+        protocol: Optional[Tuple[str, str]] = None,
+        protocol_ref: Optional[Dict[str, str]] = None,
+        ts: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Send a message through the gateway.
@@ -192,27 +316,91 @@ class GatewayClient:
             to: Recipient's agent ID
             content: Message content
             protocol: Optional (name, version) tuple for novel-language messages
+            protocol_ref: Optional pre-built {"name", "version"} dict for the
+                same protocol; sent as-is instead of being rebuilt from the tuple
+            ts: Optional send timestamp; defaults to the current time
+        """
+        payload = self._message_payload(agent_id, to, content, protocol, protocol_ref, ts)
+        return self._post("/send", payload)
+
+    def submit_report_and_send(
+        self,
+        report: EnglishReport,
+        agent_id: str,
+        to: str,
+        content: str,
+        protocol: Optional[Tuple[str, str]] = None,
+        protocol_ref: Optional[Dict[str, str]] = None,
+        ts: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Submit a report and send the message that triggered it in one request.
+        
+        The gateway only sends the message if the report is accepted; a
+        rejected report comes back as its error status, like submit_report().
+        Arguments after the report are as for send_message().
+        
+        If submit_report() or send_message() is overridden or patched (as in
+        MockGatewayClient or a test double), they are called in sequence
+        instead, and a rejected report is flagged with "report_rejected".
         """
+        if not self._uses_base_transport():
+            result = self.submit_report(report)
+            if not result.get("ok"):
+                return {**result, "report_rejected": True}
+            return self.send_message(agent_id, to, content, protocol, protocol_ref, ts)
         payload = {
+            "report": report.to_dict(),
+            "message": self._message_payload(agent_id, to, content, protocol, protocol_ref, ts),
+        }
+        return self._post("/report_with_message", payload)
+
+    def _uses_base_transport(self) -> bool:
+        """True if submit_report() and send_message() are GatewayClient's own."""
+        return (
+            getattr(self.submit_report, "__func__", None) is _BASE_SUBMIT_REPORT
+            and getattr(self.send_message, "__func__", None) is _BASE_SEND_MESSAGE
+        )
+
+    def _message_payload(
+        self,
+        agent_id: str,
+        to: str,
+        content: str,
+        protocol: Optional[Tuple[str, str]],
+        protocol_ref: Optional[Dict[str, str]],
+        ts: Optional[float]
+    ) -> Dict[str, Any]:
+        """Build the /send request body."""
+        if protocol_ref is None and protocol:
+            protocol_ref = {"name": protocol[0], "version": protocol[1]}
+        return {
             "from": agent_id,
             "to": to,
             "content": content,
-            "protocol": {"name": protocol[0], "version": protocol[1]} if protocol else None,
-            "ts": time.time(),
+            "protocol": protocol_ref,
+            "ts": time.time() if ts is None else ts,
         }
-        return self._post("/send", payload)
+
+
+# Unpatched methods, so submit_report_and_send() can spot test doubles
+_BASE_SUBMIT_REPORT = GatewayClient.submit_report
+_BASE_SEND_MESSAGE = GatewayClient.send_message
 
 
 class MockGatewayClient(GatewayClient):
     """
     Mock gateway client for testing and development.
-    Prints actions instead of making HTTP requests.
+    Logs actions instead of making HTTP requests; set MOLTBOT_LOG_LEVEL
+    to DEBUG to see every message.
     """
     
     def __init__(self, base_url: str = "http://localhost:8080", api_key: str = "mock"):
         self.base_url = base_url
         self.api_key = api_key
         self.registered_protocols: Dict[str, Dict[str, ProtocolDescriptor]] = {}
+        self._protocol_keys: Dict[Tuple[str, str], str] = {}  # (name, version) -> key
+        self._registered_keys: Set[Tuple[str, str]] = set()  # (agent_id, key)
         self.last_report_ts: Dict[str, float] = {}
         self.messages_sent: List[Dict[str, Any]] = []
         self.reports_submitted: List[EnglishReport] = []
@@ -223,7 +411,9 @@ class MockGatewayClient(GatewayClient):
             self.registered_protocols[agent_id] = {}
         key = f"{pd.name}:{pd.version}"
         self.registered_protocols[agent_id][key] = pd
-        print(f"[MockGateway] Registered protocol {key} for {agent_id}")
+        self._protocol_keys[(pd.name, pd.version)] = key
+        self._registered_keys.add((agent_id, key))
+        logger.info("[MockGateway] Registered protocol %s for %s", key, agent_id)
         return {"ok": True}
 
     def submit_report(self, report: EnglishReport) -> Dict[str, Any]:
@@ -231,9 +421,7 @@ class MockGatewayClient(GatewayClient):
         key = f"{report.protocol_name}:{report.protocol_version}"
         
         # Validate protocol registration
-        if report.agent_id not in self.registered_protocols:
-            return {"ok": False, "error": "Agent not registered"}
-        if key not in self.registered_protocols[report.agent_id]:
+        if (report.agent_id, key) not in self._registered_keys:
             return {"ok": False, "error": "Protocol not registered"}
         
         # Validate coverage
@@ -246,16 +434,24 @@ class MockGatewayClient(GatewayClient):
         
         self.reports_submitted.append(report)
         self.last_report_ts[f"{report.agent_id}::{key}"] = time.time()
-        print(f"[MockGateway] Report accepted from {report.agent_id}")
-        print(f"             Summary: {report.english_summary[:100]}...")
+        logger.info("[MockGateway] Report accepted from %s", report.agent_id)
+        logger.debug("             Summary: %s...", report.english_summary[:100])
         return {"ok": True}
 
+    def _novel_ok(self, agent_id: str, key: Optional[str], now: float) -> bool:
+        """Mock: True if the protocol is registered and its report is fresh."""
+        return (agent_id, key) in self._registered_keys and (
+            now - self.last_report_ts.get(f"{agent_id}::{key}", 0)
+        ) <= REPORT_INTERVAL_SEC
+
     def send_message(
         self, 
         agent_id: str, 
         to: str, 
         content: str, 
-        protocol: Optional[Tuple[str, str]] = None
+        protocol: Optional[Tuple[str, str]] = None,
+        protocol_ref: Optional[Dict[str, str]] = None,
+        ts: Optional[float] = None
     ) -> Dict[str, Any]:
         """Mock: Validate and store message."""
         is_english = looks_like_english(content)
@@ -263,34 +459,34 @@ class MockGatewayClient(GatewayClient):
         if is_english:
             msg = {"from": agent_id, "to": to, "content": content, "kind": "english"}
             self.messages_sent.append(msg)
-            print(f"[MockGateway] Message sent (English): {agent_id} → {to}")
+            logger.debug("[MockGateway] Message sent (English): %s → %s", agent_id, to)
             return {"ok": True}
         
-        # Novel language checks
+        # Novel language checks; a protocol_ref alone names the protocol too
+        if protocol is None and protocol_ref is not None:
+            protocol = (protocol_ref["name"], protocol_ref["version"])
         if protocol is None:
-            print(f"[MockGateway] REJECTED: Novel language without protocol")
+            logger.debug("[MockGateway] REJECTED: Novel language without protocol")
             return {"ok": False, "error": "Novel language requires protocol"}
         
-        key = f"{protocol[0]}:{protocol[1]}"
+        protocol = tuple(protocol)
+        key = self._protocol_keys.get(protocol) or f"{protocol[0]}:{protocol[1]}"
+        now = time.time()  # gateway clock, not the client-supplied ts
         
-        # Check registration
-        if agent_id not in self.registered_protocols:
-            print(f"[MockGateway] REJECTED: Agent not registered")
-            return {"ok": False, "error": "Protocol not registered"}
-        if key not in self.registered_protocols[agent_id]:
-            print(f"[MockGateway] REJECTED: Protocol {key} not registered")
-            return {"ok": False, "error": "Protocol not registered"}
-        
-        # Check report freshness
-        report_key = f"{agent_id}::{key}"
-        last = self.last_report_ts.get(report_key, 0)
-        if time.time() - last > REPORT_INTERVAL_SEC:
-            print(f"[MockGateway] REJECTED: Report overdue")
+        # Check registration and report freshness
+        if not self._novel_ok(agent_id, key, now):
+            if (agent_id, key) not in self._registered_keys:
+                logger.debug(
+                    "[MockGateway] REJECTED: Protocol %s:%s not registered",
+                    protocol[0], protocol[1]
+                )
+                return {"ok": False, "error": "Protocol not registered"}
+            logger.debug("[MockGateway] REJECTED: Report overdue")
             return {"ok": False, "error": "Report overdue"}
         
         msg = {"from": agent_id, "to": to, "content": content, "kind": "novel", "protocol": key}
         self.messages_sent.append(msg)
-        print(f"[MockGateway] Message sent (Novel): {agent_id} → {to} [{key}]")
+        logger.debug("[MockGateway] Message sent (Novel): %s → %s [%s]", agent_id, to, key)
         return {"ok": True}
 
 
@@ -309,12 +505,33 @@ class ObservableAgent:
         agent.send("agent-002", "X9|cmd=1") # Novel - requires report
     """
 
+    __slots__ = (
+        "agent_id",
+        "gateway",
+        "protocol",
+        "_protocol_tuple",
+        "_protocol_ref",
+        "_ts_buf",
+        "_id_buf",
+        "_raw_buf",
+        "_window_start_ts",
+        "_last_report_ts",
+        "_novel_count_since_report",
+        "__weakref__",
+    )
+
     def __init__(self, agent_id: str, gateway: GatewayClient) -> None:
         self.agent_id = agent_id
         self.gateway = gateway
         
         self.protocol: Optional[ProtocolDescriptor] = None
-        self._novel_buffer: List[Tuple[float, str, str]] = []  # (ts, msg_id, raw_text)
+        # Pre-built protocol references passed with every novel message
+        self._protocol_tuple: Optional[Tuple[str, str]] = None
+        self._protocol_ref: Optional[Dict[str, str]] = None
+        # Buffered novel messages, stored as parallel lists
+        self._ts_buf = array.array("d")  # unboxed timestamps
+        self._id_buf: List[str] = []
+        self._raw_buf: List[str] = []
         self._window_start_ts: float = time.time()
         self._last_report_ts: float = 0.0
         self._novel_count_since_report: int = 0
@@ -326,23 +543,43 @@ class ObservableAgent:
         """
         self.protocol = pd
         self.gateway.register_protocol(self.agent_id, pd)
+        self._protocol_tuple = (pd.name, pd.version)
+        self._protocol_ref = {"name": pd.name, "version": pd.version}
         # Reset reporting window
-        self._last_report_ts = time.time()
-        self._window_start_ts = time.time()
+        now = time.time()
+        self._last_report_ts = now
+        self._window_start_ts = now
 
-    def _needs_report(self) -> bool:
+    def _needs_report(self, now: float) -> bool:
         """Check if a report is required before sending more novel messages."""
         if self._novel_count_since_report == 0:
             return False
-        if (time.time() - self._last_report_ts) >= REPORT_INTERVAL_SEC:
+        if (now - self._last_report_ts) >= REPORT_INTERVAL_SEC:
             return True
         if self._novel_count_since_report >= REPORT_EVERY_N_MESSAGES:
             return True
         return False
 
-    def _build_english_report(self) -> EnglishReport:
+    def _reset_window(self, now: float) -> None:
         """
-        Build an English translation report for buffered novel messages.
+        Start a new reporting window once a report has been accepted.
+        
+        The buffers are swapped for fresh lists rather than cleared, so the
+        submitted report keeps its message_ids list.
+        """
+        self._ts_buf, self._id_buf, self._raw_buf = array.array("d"), [], []
+        self._novel_count_since_report = 0
+        self._last_report_ts = now
+        self._window_start_ts = now
+
+    def _build_english_report(
+        self,
+        message_ids: List[str],
+        raw_messages: List[str],
+        window_end: float
+    ) -> EnglishReport:
+        """
+        Build an English translation report for the given novel messages.
         
         Override this method in subclasses to provide actual translations
         based on your protocol's semantics.
@@ -350,14 +587,11 @@ class ObservableAgent:
         if self.protocol is None:
             raise RuntimeError("Protocol must be registered before building reports")
 
-        window_end = time.time()
-        message_ids = [mid for (_, mid, _) in self._novel_buffer]
-
         # Default implementation: placeholder summary
         # In production, decode messages using your protocol's translation method
         english_summary = (
             f"English report for protocol {self.protocol.name} v{self.protocol.version}. "
-            f"Covered {len(self._novel_buffer)} novel-language messages in this window. "
+            f"Covered {len(message_ids)} novel-language messages in this window. "
             f"Translation method: {self.protocol.translation_method}. "
             "Summary: messages contained compressed task state updates and coordination signals; "
             "no external actions should be taken without explicit tool authorization."
@@ -376,24 +610,29 @@ class ObservableAgent:
             notes="Auto-generated report; subject to audit sampling.",
         )
 
-    def _submit_report_and_reset(self) -> None:
-        """Submit the current report and reset the reporting window."""
-        report = self._build_english_report()
+    def _prepare_report(self, now: float) -> EnglishReport:
+        """
+        Build and validate the report for the buffered messages.
+        
+        Override this to evaluate or veto reports; raising blocks the send.
+        """
+        report = self._build_english_report(self._id_buf, self._raw_buf, now)
 
         if report.coverage < MIN_COVERAGE:
             raise RuntimeError(
                 f"Report coverage {report.coverage} below minimum {MIN_COVERAGE}"
             )
+        return report
+
+    def _submit_report_and_reset(self, now: float) -> None:
+        """Submit the current report and reset the reporting window."""
+        report = self._prepare_report(now)
 
         result = self.gateway.submit_report(report)
         if not result.get("ok"):
             raise RuntimeError(f"Report rejected: {result.get('error', 'unknown')}")
 
-        # Reset tracking
-        self._last_report_ts = time.time()
-        self._window_start_ts = self._last_report_ts
-        self._novel_buffer.clear()
-        self._novel_count_since_report = 0
+        self._reset_window(now)
 
     def send(self, to: str, content: str) -> Dict[str, Any]:
         """
@@ -413,11 +652,12 @@ class ObservableAgent:
             PermissionError: If novel language used without protocol registration
             RuntimeError: If report submission fails
         """
+        now = time.time()
         is_english = looks_like_english(content)
         
         if is_english:
             return self.gateway.send_message(
-                self.agent_id, to, content, protocol=None
+                self.agent_id, to, content, protocol=None, ts=now
             )
 
         # Novel language: require protocol registration
@@ -428,20 +668,48 @@ class ObservableAgent:
             )
 
         # Buffer this message for reporting
-        msg_id = sha256_hex(content + str(time.time()))
-        self._novel_buffer.append((time.time(), msg_id, content))
+        msg_id = _msg_id(content, now)
+        self._ts_buf.append(now)
+        self._id_buf.append(msg_id)
+        self._raw_buf.append(content)
         self._novel_count_since_report += 1
 
-        # Submit report if needed BEFORE sending
-        if self._needs_report():
-            self._submit_report_and_reset()
+        # Submit report if needed BEFORE sending, in the same request unless
+        # a subclass has taken over report submission
+        if self._needs_report(now):
+            if type(self)._submit_report_and_reset is not ObservableAgent._submit_report_and_reset:
+                self._submit_report_and_reset(now)
+                return self.gateway.send_message(
+                    self.agent_id,
+                    to,
+                    content,
+                    protocol=self._protocol_tuple,
+                    protocol_ref=self._protocol_ref,
+                    ts=now
+                )
+            report = self._prepare_report(now)
+            result = self.gateway.submit_report_and_send(
+                report,
+                self.agent_id,
+                to,
+                content,
+                protocol=self._protocol_tuple,
+                protocol_ref=self._protocol_ref,
+                ts=now
+            )
+            if result.get("report_rejected"):
+                raise RuntimeError(f"Report rejected: {result.get('error', 'unknown')}")
+            self._reset_window(now)
+            return result
 
         # Send through gateway with declared protocol
         return self.gateway.send_message(
             self.agent_id, 
             to, 
             content, 
-            protocol=(self.protocol.name, self.protocol.version)
+            protocol=self._protocol_tuple,
+            protocol_ref=self._protocol_ref,
+            ts=now
         )
 
     def flush_report(self) -> None:
@@ -449,8 +717,8 @@ class ObservableAgent:
         Force submission of a report for any buffered messages.
         Call this when shutting down or pausing the agent.
         """
-        if self._novel_buffer:
-            self._submit_report_and_reset()
+        if self._id_buf:
+            self._submit_report_and_reset(time.time())
 
 
 # -----------------------------
@@ -458,6 +726,8 @@ class ObservableAgent:
 # -----------------------------
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+
     # Use mock gateway for demonstration
     gateway = MockGatewayClient()
     agent = ObservableAgent(agent_id="agent-123", gateway=gateway)